@@ -519,16 +519,87 @@
 
 import streamlit as st 
 from abc import ABC, abstractmethod
+import heapq
 import json
-from datetime import datetime
+import mmap
+import os
+import stat
+import threading
+import uuid
+from datetime import date, datetime
+from itertools import count, islice
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# ----------------------- Serialization Helpers -----------------------
+def _dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _load(f):
+    if orjson is None:
+        return json.load(f)
+    # Parse straight from a read-only mapping of the file instead of copying it into a bytes object first
+    if os.fstat(f.fileno()).st_size == 0:
+        return orjson.loads(b"")  # mmap refuses empty files; let orjson raise the usual decode error
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+        return orjson.loads(view)
+
+def _write_atomic(filename, chunks):
+    # Write to a sibling temp file and swap it in, so a crash mid-save never truncates the inventory
+    dirname = os.path.dirname(os.path.abspath(filename))
+    tmp_name = os.path.join(dirname, f".{os.path.basename(filename)}.{uuid.uuid4().hex}.tmp")
+    # Created with 0666 like a plain open(), so the kernel applies the umask to a new file's mode
+    fd = os.open(tmp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        with os.fdopen(fd, "wb", buffering=1 << 20) as f:
+            for chunk in chunks:
+                f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(os.stat(filename).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+def _require_msgpack():
+    if msgpack is None:
+        raise ImportError("msgpack is not installed; run 'pip install msgpack' to use .msgpack inventory files")
+
+# ----------------------- Exceptions -----------------------
+class NotEnoughStock(Exception):
+    pass
+
+class ProductNotFound(LookupError):
+    pass
+
+class DuplicateProductID(Exception):
+    pass
 
 # ----------------------- Product Base Class -----------------------
 class Product(ABC):
+    __slots__ = ("_product_id", "_name", "_price", "_quantity_in_stock", "_dict_cache", "_str_cache")
+
     def __init__(self, product_id, name, price, quantity_in_stock):
         self._product_id = product_id
         self._name = name
         self._price = price
         self._quantity_in_stock = quantity_in_stock
+        self._dict_cache = None
+        self._str_cache = None
 
     @abstractmethod
     def __str__(self):
@@ -538,405 +609,354 @@ class Product(ABC):
         if amount < 1:
             raise ValueError("Restock amount must be at least 1")
         self._quantity_in_stock += amount
+        self._dict_cache = None
+        self._str_cache = None
 
     def sell(self, quantity):
         if quantity < 1:
             raise ValueError("Sell quantity must be at least 1")
         if quantity > self._quantity_in_stock:
-            raise Exception("Not enough stock to sell")
+            raise NotEnoughStock("Not enough stock to sell")
         self._quantity_in_stock -= quantity
+        self._dict_cache = None
+        self._str_cache = None
 
     def get_total_value(self):
         return self._price * self._quantity_in_stock
 
     def to_dict(self):
-        return {
-            "type": self.__class__.__name__,
-            "product_id": self._product_id,
-            "name": self._name,
-            "price": self._price,
-            "quantity_in_stock": self._quantity_in_stock,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    @abstractmethod
+    def _build_dict(self):
+        pass
 
 # ----------------------- Subclasses -----------------------
 class Electronics(Product):
+    __slots__ = ("brand", "warranty_years")
+    TYPE_NAME = "Electronics"
+
     def __init__(self, product_id, name, price, quantity_in_stock, brand, warranty_years):
         super().__init__(product_id, name, price, quantity_in_stock)
         self.brand = brand
         self.warranty_years = warranty_years
 
     def __str__(self):
-        return f"🔌 Electronics: {self._name}, Brand: {self.brand}, Warranty: {self.warranty_years} years, Stock: {self._quantity_in_stock}"
+        if self._str_cache is None:
+            self._str_cache = f"🔌 Electronics: {self._name}, Brand: {self.brand}, Warranty: {self.warranty_years} years, Stock: {self._quantity_in_stock}"
+        return self._str_cache
 
-    def to_dict(self):
-        data = super().to_dict()
-        data.update({"brand": self.brand, "warranty_years": self.warranty_years})
-        return data
+    def _build_dict(self):
+        return {
+            "type": self.TYPE_NAME,
+            "product_id": self._product_id,
+            "name": self._name,
+            "price": self._price,
+            "quantity_in_stock": self._quantity_in_stock,
+            "brand": self.brand,
+            "warranty_years": self.warranty_years,
+        }
 
 class Grocery(Product):
+    __slots__ = ("expiry_date", "_expiry")
+    TYPE_NAME = "Grocery"
+
     def __init__(self, product_id, name, price, quantity_in_stock, expiry_date):
         super().__init__(product_id, name, price, quantity_in_stock)
         self.expiry_date = expiry_date
+        self._expiry = datetime.strptime(expiry_date, "%Y-%m-%d").date()
 
-    def is_expired(self):
-        return datetime.strptime(self.expiry_date, "%Y-%m-%d") < datetime.today()
+    def is_expired(self, today=None):
+        return self._expiry <= (today or date.today())
 
     def __str__(self):
-        return f"🍎 Grocery: {self._name}, Expiry: {self.expiry_date}, Stock: {self._quantity_in_stock}"
+        if self._str_cache is None:
+            self._str_cache = f"🍎 Grocery: {self._name}, Expiry: {self.expiry_date}, Stock: {self._quantity_in_stock}"
+        return self._str_cache
 
-    def to_dict(self):
-        data = super().to_dict()
-        data.update({"expiry_date": self.expiry_date})
-        return data
+    def _build_dict(self):
+        return {
+            "type": self.TYPE_NAME,
+            "product_id": self._product_id,
+            "name": self._name,
+            "price": self._price,
+            "quantity_in_stock": self._quantity_in_stock,
+            "expiry_date": self.expiry_date,
+        }
 
 class Clothing(Product):
+    __slots__ = ("size", "material")
+    TYPE_NAME = "Clothing"
+
     def __init__(self, product_id, name, price, quantity_in_stock, size, material):
         super().__init__(product_id, name, price, quantity_in_stock)
         self.size = size
         self.material = material
 
     def __str__(self):
-        return f"👕 Clothing: {self._name}, Size: {self.size}, Material: {self.material}, Stock: {self._quantity_in_stock}"
+        if self._str_cache is None:
+            self._str_cache = f"👕 Clothing: {self._name}, Size: {self.size}, Material: {self.material}, Stock: {self._quantity_in_stock}"
+        return self._str_cache
 
-    def to_dict(self):
-        data = super().to_dict()
-        data.update({"size": self.size, "material": self.material})
-        return data
+    def _build_dict(self):
+        return {
+            "type": self.TYPE_NAME,
+            "product_id": self._product_id,
+            "name": self._name,
+            "price": self._price,
+            "quantity_in_stock": self._quantity_in_stock,
+            "size": self.size,
+            "material": self.material,
+        }
+
+# Stored keys match the constructor parameters, so saved rows can be passed straight through as kwargs
+_PRODUCT_TYPES = {cls.TYPE_NAME: cls for cls in (Electronics, Grocery, Clothing)}
+# Type lookups go through TYPE_NAME strings, never class identity: Streamlit re-executes this module on every
+# rerun, so products added in a later run are instances of fresh class objects the cached Inventory has never seen
+_TYPE_MAP = {name.lower(): name for name in _PRODUCT_TYPES}
+
+def _build_products(rows):
+    # Rows may be cached to_dict() results, so read "type" without popping it off the caller's dict
+    return (
+        _PRODUCT_TYPES[row["type"]](**{k: v for k, v in row.items() if k != "type"})
+        for row in rows if row["type"] in _PRODUCT_TYPES
+    )
 
 # ----------------------- Inventory Class -----------------------
 class Inventory:
     def __init__(self):
         self._products = {}
+        self._name_lower = {}
+        self._by_type = {name: {} for name in _PRODUCT_TYPES}
+        self._total_value = 0.0
+        self._version = 0
+        self._expiry_heap = []
+        self._expiry_stale = 0
+        # Ties on expiry fall through to this counter, never to product IDs, which may mix int and str
+        self._expiry_seq = count()
+        # One Inventory is shared by every session's script thread (see get_inventory)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._products)
+
+    def _index_product(self, product):
+        self._name_lower[product._product_id] = product._name.lower()
+        self._by_type.setdefault(product.TYPE_NAME, {})[product._product_id] = product
+        self._total_value += product.get_total_value()
+        if product.TYPE_NAME == "Grocery":
+            heapq.heappush(self._expiry_heap, (product._expiry, next(self._expiry_seq), product._product_id))
+
+    def _unindex_product(self, product):
+        del self._name_lower[product._product_id]
+        del self._by_type[product.TYPE_NAME][product._product_id]
+        if self._products:
+            self._total_value -= product.get_total_value()
+        else:
+            self._total_value = 0.0  # don't let float rounding leave a stray -0.00 behind
+
+    def _make_expiry_heap(self, groceries):
+        heap = [(p._expiry, next(self._expiry_seq), pid) for pid, p in groceries.items()]
+        heapq.heapify(heap)
+        return heap
+
+    def _rebuild_expiry_heap(self):
+        self._expiry_heap = self._make_expiry_heap(self._by_type["Grocery"])
+        self._expiry_stale = 0
+
+    def _on_stock_change(self, product, delta):
+        self._total_value += product._price * delta
 
     def add_product(self, product):
-        if not product._product_id:
-            raise ValueError("Product ID cannot be empty")
-        if product._product_id in self._products:
-            raise Exception("Duplicate product ID")
-        self._products[product._product_id] = product
+        with self._lock:
+            if not product._product_id:
+                raise ValueError("Product ID cannot be empty")
+            if product._product_id in self._products:
+                raise DuplicateProductID("Duplicate product ID")
+            self._products[product._product_id] = product
+            self._index_product(product)
+            self._version += 1
 
     def remove_product(self, product_id):
-        if product_id in self._products:
-            del self._products[product_id]
-        else:
-            raise Exception("Product ID not found")
+        with self._lock:
+            product = self._products.pop(product_id, None)
+            if product is None:
+                raise ProductNotFound("Product ID not found")
+            self._unindex_product(product)
+            if product.TYPE_NAME == "Grocery":
+                # Its heap entry stays behind; rebuild once such leftovers are the majority
+                self._expiry_stale += 1
+                if self._expiry_stale * 2 > len(self._expiry_heap):
+                    self._rebuild_expiry_heap()
+            self._version += 1
 
     def list_all_products(self):
-        return [str(p) for p in self._products.values()]
+        with self._lock:
+            return [str(p) for p in self._products.values()]
+
+    def list_products(self, start, stop):
+        with self._lock:
+            return [str(p) for p in islice(self._products.values(), start, stop)]
 
     def search_by_name(self, name):
-        return [p for p in self._products.values() if name.lower() in p._name.lower()]
+        with self._lock:
+            needle = name.lower()
+            return [self._products[pid] for pid, n in self._name_lower.items() if needle in n]
 
     def search_by_type(self, product_type):
-        return [p for p in self._products.values() if p.__class__.__name__.lower() == product_type.lower()]
+        with self._lock:
+            type_name = _TYPE_MAP.get(product_type.lower())
+            return list(self._by_type[type_name].values()) if type_name else []
 
     def sell_product(self, product_id, quantity):
-        if product_id not in self._products:
-            raise Exception("Product ID not found")
-        self._products[product_id].sell(quantity)
+        with self._lock:
+            product = self._products.get(product_id)
+            if product is None:
+                raise ProductNotFound("Product ID not found")
+            product.sell(quantity)
+            self._on_stock_change(product, -quantity)
+            self._version += 1
 
     def restock_product(self, product_id, quantity):
-        if product_id not in self._products:
-            raise Exception("Product ID not found")
-        self._products[product_id].restock(quantity)
+        with self._lock:
+            product = self._products.get(product_id)
+            if product is None:
+                raise ProductNotFound("Product ID not found")
+            product.restock(quantity)
+            self._on_stock_change(product, quantity)
+            self._version += 1
 
     def total_inventory_value(self):
-        return sum(p.get_total_value() for p in self._products.values())
+        return self._total_value
 
     def remove_expired_products(self):
-        expired = [pid for pid, p in self._products.items() if isinstance(p, Grocery) and p.is_expired()]
-        for pid in expired:
-            del self._products[pid]
+        with self._lock:
+            today = date.today()
+            heap = self._expiry_heap
+            removed = False
+            while heap and heap[0][0] <= today:
+                expiry, _, pid = heapq.heappop(heap)
+                p = self._products.get(pid)
+                # Entries for products that were removed or replaced since being pushed are just dropped
+                if p is not None and p.TYPE_NAME == "Grocery" and p._expiry == expiry:
+                    self._unindex_product(self._products.pop(pid))
+                    removed = True
+                else:
+                    self._expiry_stale -= 1
+            if removed:
+                self._version += 1
+
+    def _iter_json(self):
+        yield b"["
+        sep = b""
+        for p in self._products.values():
+            yield sep
+            yield _dumps(p.to_dict())
+            sep = b","
+        yield b"]"
+
+    def _iter_msgpack(self):
+        packer = msgpack.Packer(use_bin_type=True)
+        yield packer.pack_array_header(len(self._products))
+        for p in self._products.values():
+            yield packer.pack(p.to_dict())
 
     def save_to_file(self, filename):
-        data = [p.to_dict() for p in self._products.values()]
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=4)
+        with self._lock:
+            _write_atomic(filename, self._iter_json())
 
     def load_from_file(self, filename):
-        with open(filename, "r") as f:
-            data = json.load(f)
-        self._products.clear() 
-        for item in data:
-            ptype = item["type"]
-            if ptype == "Electronics":
-                p = Electronics(item["product_id"], item["name"], item["price"], item["quantity_in_stock"], item["brand"], item["warranty_years"])
-            elif ptype == "Grocery":
-                p = Grocery(item["product_id"], item["name"], item["price"], item["quantity_in_stock"], item["expiry_date"])
-            elif ptype == "Clothing":
-                p = Clothing(item["product_id"], item["name"], item["price"], item["quantity_in_stock"], item["size"], item["material"])
-            else:
-                continue
-            self._products[p._product_id] = p
+        with open(filename, "rb") as f:
+            data = _load(f)
+        self.bulk_load(_build_products(data))
+
+    def save_to_msgpack(self, filename):
+        _require_msgpack()
+        with self._lock:
+            _write_atomic(filename, self._iter_msgpack())
+
+    def load_from_msgpack(self, filename):
+        _require_msgpack()
+        with open(filename, "rb") as f:
+            data = msgpack.unpackb(f.read(), raw=False)
+        self.bulk_load(_build_products(data))
+
+    def bulk_load(self, products):
+        with self._lock:
+            products = {p._product_id: p for p in products}
+            by_type = {name: {} for name in _PRODUCT_TYPES}
+            for pid, p in products.items():
+                by_type.setdefault(p.TYPE_NAME, {})[pid] = p
+            name_lower = {pid: p._name.lower() for pid, p in products.items()}
+            total_value = sum(p.get_total_value() for p in products.values())
+            expiry_heap = self._make_expiry_heap(by_type["Grocery"])
+            # Everything is built before the first assignment, so a failure above leaves the inventory as it was
+            self._products = products
+            self._name_lower = name_lower
+            self._by_type = by_type
+            self._total_value = total_value
+            self._expiry_heap = expiry_heap
+            self._expiry_stale = 0
+            self._version += 1
 
 # ----------------------- Streamlit UI -----------------------
 st.set_page_config(page_title="🌟 Inventory System", layout="centered")
 
-st.markdown("""
-<style>
-    /* General App Styling */
-    .stApp, .stApp * {
-        color: #262730 !important;
-    }
-    .stApp {
-        background: linear-gradient(to right, #e3f2fd, #f0f4f8) !important;
-        font-family: 'Segoe UI', sans-serif !important;
-        padding: 1rem !important;
-    }
-
-    /* Headings */
-    h1, h2, h3, .stSubheader, .stHeader {
-        color: #0d47a1 !important;
-        font-weight: bold !important;
-    }
-
-    .main-title {
-        color: #0d47a1 !important;
-        text-align: center !important;
-        font-weight: bold !important;
-        margin-bottom: 2rem !important;
-    }
-
-    /* Tabs Styling */
-    .stTabs [data-baseweb="tab-list"] button {
-        color: #262730 !important;
-        font-weight: 600 !important;
-        background: transparent !important;
-        border: none !important;
-    }
-    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
-        color: #0d47a1 !important;
-        border-bottom: 2px solid #0d47a1 !important;
-    }
-
-    /* Labels */
-    label {
-        color: #262730 !important;
-        font-weight: 600 !important;
-    }
-
-    /* Input Fields */
-    .stTextInput > div > div > input,
-    .stNumberInput input,
-    .stDateInput input {
-        color: #262730 !important;
-        background-color: #ffffff !important;
-        border: 2px solid #90caf9 !important;
-        border-radius: 10px !important;
-        padding: 10px !important;
-        font-size: 1rem !important;
-    }
-
-    /* Selectbox - FIXED MOBILE STYLING */
-    .stSelectbox > div > div {
-        color: #262730 !important;
-        background-color: #ffffff !important;
-        border: 2px solid #90caf9 !important;
-        border-radius: 10px !important;
-        min-height: 48px !important;
-    }
-
-    /* Selectbox main container */
-    .stSelectbox div[data-baseweb="select"] {
-        background-color: #ffffff !important;
-        border: none !important;
-        border-radius: 10px !important;
-        min-height: 48px !important;
-    }
-
-    /* Selectbox button (clickable area) */
-    .stSelectbox div[data-baseweb="select"] > div {
-        color: #262730 !important;
-        background-color: #ffffff !important;
-        border: none !important;
-        padding: 12px 16px !important;
-        font-size: 1rem !important;
-        line-height: 1.4 !important;
-        min-height: 44px !important;
-        display: flex !important;
-        align-items: center !important;
-        justify-content: space-between !important;
-    }
-
-    /* Selected value text */
-    .stSelectbox div[data-baseweb="select"] div[role="button"] span {
-        color: #262730 !important;
-        font-size: 1rem !important;
-        line-height: 1.4 !important;
-    }
-
-    /* Dropdown arrow */
-    .stSelectbox div[data-baseweb="select"] svg {
-        color: #262730 !important;
-        width: 20px !important;
-        height: 20px !important;
-        flex-shrink: 0 !important;
-    }
-
-    /* Dropdown menu when opened */
-    .stSelectbox div[data-baseweb="select"] div[role="listbox"] {
-        background-color: #ffffff !important;
-        border: 2px solid #90caf9 !important;
-        border-radius: 10px !important;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.1) !important;
-        z-index: 999999 !important;
-        position: relative !important;
-    }
-
-    /* Dropdown menu items */
-    .stSelectbox div[data-baseweb="select"] [role="option"] {
-        color: #262730 !important;
-        background-color: #ffffff !important;
-        padding: 12px 16px !important;
-        font-size: 1rem !important;
-        line-height: 1.4 !important;
-        border-bottom: 1px solid #f0f0f0 !important;
-    }
-
-    /* Dropdown menu items on hover */
-    .stSelectbox div[data-baseweb="select"] [role="option"]:hover {
-        background-color: #e3f2fd !important;
-        color: #0d47a1 !important;
-    }
-
-    /* Number Input Buttons */
-    .stNumberInput button {
-        background-color: #2196f3 !important;
-        color: #000000 !important;
-        border: none !important;
-        min-width: 40px !important;
-        min-height: 40px !important;
-        cursor: pointer !important;
-        transition: background-color 0.3s ease !important;
-    }
-    .stNumberInput button:hover {
-        background-color: #1565c0 !important;
-    }
-    .stNumberInput > div > div {
-        border-radius: 10px !important;
-        overflow: hidden !important;
-        border: 2px solid #90caf9 !important;
-        display: flex !important;
-        align-items: center !important;
-    }
-
-    /* Button Styling */
-    .stButton > button {
-        background-color: #2196f3 !important;
-        color: white !important;
-        font-weight: bold !important;
-        border: none !important;
-        padding: 0.75rem 1.5rem !important;
-        border-radius: 10px !important;
-        font-size: 1rem !important;
-        cursor: pointer !important;
-        transition: background-color 0.3s ease !important;
-        width: 100% !important;
-        margin-top: 10px !important;
-    }
-    .stButton > button:hover {
-        background-color: #1976d2 !important;
-    }
-
-    /* Mobile Responsive Styling */
-    @media only screen and (max-width: 768px) {
-        .stApp {
-            padding: 0.5rem !important;
-        }
-        
-        /* Mobile selectbox fixes */
-        .stSelectbox {
-            width: 100% !important;
-            margin-bottom: 1rem !important;
-        }
-        
-        .stSelectbox > div {
-            width: 100% !important;
-        }
-        
-        .stSelectbox > div > div {
-            width: 100% !important;
-            min-height: 52px !important;
-        }
-        
-        .stSelectbox div[data-baseweb="select"] {
-            width: 100% !important;
-            min-height: 52px !important;
-        }
-        
-        .stSelectbox div[data-baseweb="select"] > div {
-            width: 100% !important;
-            min-height: 48px !important;
-            padding: 14px 16px !important;
-            font-size: 16px !important; /* Prevents zoom on iOS */
-        }
-        
-        /* Dropdown menu mobile fixes */
-        .stSelectbox div[data-baseweb="select"] div[role="listbox"] {
-            width: 100% !important;
-            max-height: 200px !important;
-            overflow-y: auto !important;
-            position: fixed !important;
-            z-index: 999999 !important;
-        }
-        
-        .stSelectbox div[data-baseweb="select"] [role="option"] {
-            padding: 16px !important;
-            font-size: 16px !important;
-            min-height: 48px !important;
-            display: flex !important;
-            align-items: center !important;
-        }
-        
-        .stTextInput, .stNumberInput, .stDateInput, .stButton {
-            width: 100% !important;
-            margin-bottom: 1rem !important;
-        }
-        
-        .stTabs [data-baseweb="tab-list"] {
-            flex-wrap: wrap !important;
-        }
-        
-        .stTabs [data-baseweb="tab-list"] button {
-            min-width: 80px !important;
-            padding: 8px 12px !important;
-            font-size: 14px !important;
-        }
-        
-        /* Input field mobile optimization */
-        .stTextInput > div > div > input,
-        .stNumberInput input,
-        .stDateInput input {
-            font-size: 16px !important; /* Prevents zoom on iOS */
-            padding: 12px !important;
-            min-height: 48px !important;
-        }
-    }
-
-    /* Ensure proper stacking context */
-    .stSelectbox {
-        position: relative !important;
-        z-index: 100 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+CSS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "styles.css")
+
+@st.cache_data
+def _load_css(path):
+    with open(path) as f:
+        return f.read()
+
+st.markdown(f"<style>\n{_load_css(CSS_PATH)}</style>", unsafe_allow_html=True)
 
 
 st.markdown("""
 <h1 class="main-title">⚙️ Inventory Management System</h1>
 """, unsafe_allow_html=True)
 
-# Session State Setup
-if 'inventory' not in st.session_state:
-    st.session_state.inventory = Inventory()
+# Shared Inventory Setup (loaded once per server process, not once per session)
+# inventory.msgpack is the canonical store when msgpack is installed; JSON stays for interchange
+DEFAULT_FILE = "inventory.msgpack" if msgpack is not None else "inventory.json"
+
+@st.cache_resource(show_spinner="Loading inventory...")
+def get_inventory(msgpack_path="inventory.msgpack", json_path="inventory.json"):
+    inv = Inventory()
     try:
-        st.session_state.inventory.load_from_file("inventory.json")
+        if msgpack is not None and os.path.exists(msgpack_path):
+            inv.load_from_msgpack(msgpack_path)
+        else:
+            inv.load_from_file(json_path)
     except FileNotFoundError:
         pass
+    return inv
+
+# A failed load raises out of get_inventory, so it is not cached and the next session retries it
+if "inventory" in st.session_state:
+    inv = st.session_state.inventory
+else:
+    try:
+        inv = get_inventory()
     except Exception as e:
         st.error(f"Error loading inventory: {e}")
+        inv = st.session_state.inventory = Inventory()
+
+PAGE_SIZE = 100
 
-inv = st.session_state.inventory
+@st.cache_data(max_entries=32)
+def _render_page(version, inv_id, page, _inv):
+    start = PAGE_SIZE * (page - 1)
+    return "\n".join(f"- {line}" for line in _inv.list_products(start, start + PAGE_SIZE))
+
+# Paging only reruns this fragment, not the whole app
+@st.fragment
+def _inventory_page(inv):
+    pages = -(-len(inv) // PAGE_SIZE)
+    page = st.number_input("Page", min_value=1, max_value=pages, step=1) if pages > 1 else 1
+    st.markdown(_render_page(inv._version, id(inv), page, inv))
 
 # Tabs as the menu
 tabs = st.tabs(["Add Product", "View Inventory", "Sell Product", "Restock Product", "Save", "Load", "Remove Expired"])
@@ -945,24 +965,27 @@ with tabs[0]:  # Add Product
     st.header("➕ Add New Product")
 
     ptype = st.selectbox("Select Product Type", ["Choose an option", "Electronics", "Grocery", "Clothing"])
-    pid = st.text_input("Product ID").strip()
-    name = st.text_input("Product Name").strip()
+    st.text_input("Product ID", key="add_pid")
+    st.text_input("Product Name", key="add_name")
     price = st.number_input("Price", min_value=0.01, format="%.2f")
     quantity = st.number_input("Quantity", min_value=1, step=1, format="%d")
 
     # Specific inputs per product type
     if ptype == "Electronics":
-        brand = st.text_input("Brand").strip()
+        st.text_input("Brand", key="add_brand")
         warranty = st.number_input("Warranty (Years)", min_value=0, step=1)
 
     elif ptype == "Grocery":
         expiry_date = st.date_input("Expiry Date")
 
     elif ptype == "Clothing":
-        size = st.text_input("Size (e.g. M, L, XL)").strip()
-        material = st.text_input("Material").strip()
+        st.text_input("Size (e.g. M, L, XL)", key="add_size")
+        st.text_input("Material", key="add_material")
 
     if st.button(f"Add {ptype}" if ptype != "Choose an option" else "Add Product"):
+        pid = st.session_state.add_pid.strip()
+        name = st.session_state.add_name.strip()
+
         # Basic validation
         if ptype == "Choose an option":
             st.error("Please select a product type.")
@@ -977,6 +1000,7 @@ with tabs[0]:  # Add Product
         else:
             try:
                 if ptype == "Electronics":
+                    brand = st.session_state.add_brand.strip()
                     if not brand:
                         st.error("Brand cannot be empty.")
                     else:
@@ -991,6 +1015,8 @@ with tabs[0]:  # Add Product
                     st.success(f"Grocery product '{name}' added successfully!")
 
                 elif ptype == "Clothing":
+                    size = st.session_state.add_size.strip()
+                    material = st.session_state.add_material.strip()
                     if not size or not material:
                         st.error("Size and Material cannot be empty.")
                     else:
@@ -1003,19 +1029,18 @@ with tabs[0]:  # Add Product
 
 with tabs[1]:  # View Inventory
     st.header("📋 Current Inventory")
-    products = inv.list_all_products()
-    if products:
-        for p in products:
-            st.write("- ", p)
+    if len(inv):
+        _inventory_page(inv)
     else:
         st.info("No products in inventory.")
     st.info(f"💰 **Total Inventory Value:** ${inv.total_inventory_value():,.2f}")
 
 with tabs[2]:  # Sell Product
     st.header("🛒 Sell Product")
-    sell_pid = st.text_input("Product ID to Sell").strip()
+    st.text_input("Product ID to Sell", key="sell_pid")
     sell_qty = st.number_input("Quantity to Sell", min_value=1, step=1)
     if st.button("Sell"):
+        sell_pid = st.session_state.sell_pid.strip()
         if not sell_pid:
             st.error("Enter a Product ID.")
         else:
@@ -1027,9 +1052,10 @@ with tabs[2]:  # Sell Product
 
 with tabs[3]:  # Restock Product
     st.header("🔄 Restock Product")
-    restock_pid = st.text_input("Product ID to Restock").strip()
+    st.text_input("Product ID to Restock", key="restock_pid")
     restock_qty = st.number_input("Quantity to Restock", min_value=1, step=1)
     if st.button("Restock"):
+        restock_pid = st.session_state.restock_pid.strip()
         if not restock_pid:
             st.error("Enter a Product ID.")
         else:
@@ -1041,20 +1067,26 @@ with tabs[3]:  # Restock Product
 
 with tabs[4]:  # Save
     st.header("💾 Save Inventory to File")
-    filename_save = st.text_input("Filename to save (e.g., inventory.json)", value="inventory.json")
+    filename_save = st.text_input("Filename to save (e.g., inventory.json or inventory.msgpack)", value=DEFAULT_FILE)
     if st.button("Save"):
         try:
-            inv.save_to_file(filename_save)
+            if filename_save.endswith(".msgpack"):
+                inv.save_to_msgpack(filename_save)
+            else:
+                inv.save_to_file(filename_save)
             st.success(f"Inventory saved to {filename_save}")
         except Exception as e:
             st.error(str(e))
 
 with tabs[5]:  # Load
     st.header("📂 Load Inventory from File")
-    filename_load = st.text_input("Filename to load (e.g., inventory.json)", value="inventory.json")
+    filename_load = st.text_input("Filename to load (e.g., inventory.json or inventory.msgpack)", value=DEFAULT_FILE)
     if st.button("Load"):
         try:
-            inv.load_from_file(filename_load)
+            if filename_load.endswith(".msgpack"):
+                inv.load_from_msgpack(filename_load)
+            else:
+                inv.load_from_file(filename_load)
             st.success(f"Inventory loaded from {filename_load}")
         except FileNotFoundError:
             st.error(f"File '{filename_load}' not found.")
@@ -0,0 +1,111 @@
+import json
+import os
+
+import pytest
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+SAVE_AS = "Filename to save (e.g., inventory.json or inventory.msgpack)"
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "inventory.json").write_text(json.dumps([]))
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    yield at
+    st.cache_resource.clear()
+    st.cache_data.clear()
+
+
+def widget(at, kind, label):
+    return next(w for w in getattr(at, kind) if w.label == label)
+
+
+def listing(at):
+    return [m.value for m in at.markdown if str(m.value).startswith("- ")]
+
+
+def test_grocery_added_in_later_run_is_removed_when_expired(app):
+    # Every rerun re-executes main.py, so the grocery is built from different class objects than the cached Inventory
+    widget(app, "selectbox", "Select Product Type").set_value("Grocery")
+    app.run()
+    widget(app, "text_input", "Product ID").set_value("G9")
+    widget(app, "text_input", "Product Name").set_value("Milk")
+    widget(app, "button", "Add Grocery").click()  # expiry defaults to today
+    app.run()
+    assert [s.value for s in app.success] == ["Grocery product 'Milk' added successfully!"]
+
+    widget(app, "button", "Remove Expired").click()
+    app.run()
+    app.run()  # the View tab renders before Remove Expired, so it catches up on the next run
+    assert not app.exception
+    assert listing(app) == []
+
+
+def test_save_keeps_existing_file_mode(app, tmp_path):
+    target = tmp_path / "inventory.json"
+    os.chmod(target, 0o644)
+    widget(app, "text_input", SAVE_AS).set_value("inventory.json")
+    widget(app, "button", "Save").click()
+    app.run()
+    assert [s.value for s in app.success] == ["Inventory saved to inventory.json"]
+    assert oct(target.stat().st_mode & 0o777) == oct(0o644)
+
+
+def test_broken_inventory_file_is_retried_by_new_session(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "inventory.json").write_text("not json")
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    try:
+        at = AppTest.from_file(APP, default_timeout=30).run()
+        assert [e.value for e in at.error][0].startswith("Error loading inventory:")
+
+        (tmp_path / "inventory.json").write_text(json.dumps(
+            [{"type": "Clothing", "product_id": "C1", "name": "Shirt", "price": 10.0,
+              "quantity_in_stock": 2, "size": "M", "material": "Cotton"}]))
+        at = AppTest.from_file(APP, default_timeout=30).run()
+        assert not at.error
+        assert len(listing(at)) == 1
+    finally:
+        st.cache_resource.clear()
+        st.cache_data.clear()
+
+
+def test_save_new_file_honours_umask(app, tmp_path):
+    old = os.umask(0o027)
+    try:
+        widget(app, "text_input", SAVE_AS).set_value("new.json")
+        widget(app, "button", "Save").click()
+        app.run()
+    finally:
+        os.umask(old)
+    assert [s.value for s in app.success] == ["Inventory saved to new.json"]
+    assert oct((tmp_path / "new.json").stat().st_mode & 0o777) == oct(0o640)
+    assert [p.name for p in tmp_path.iterdir() if p.suffix == ".tmp"] == []
+
+
+def test_msgpack_round_trip_is_preferred_on_startup(app, tmp_path):
+    pytest.importorskip("msgpack")
+    widget(app, "selectbox", "Select Product Type").set_value("Clothing")
+    app.run()
+    widget(app, "text_input", "Product ID").set_value("C1")
+    widget(app, "text_input", "Product Name").set_value("Shirt")
+    widget(app, "text_input", "Size (e.g. M, L, XL)").set_value("M")
+    widget(app, "text_input", "Material").set_value("Cotton")
+    widget(app, "button", "Add Clothing").click()
+    app.run()
+    widget(app, "button", "Save").click()  # the default filename is inventory.msgpack
+    app.run()
+    assert [s.value for s in app.success] == ["Inventory saved to inventory.msgpack"]
+
+    # A fresh server process prefers inventory.msgpack over the empty inventory.json
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    at = AppTest.from_file(APP, default_timeout=30).run()
+    assert not at.error
+    assert listing(at) == ["- 👕 Clothing: Shirt, Size: M, Material: Cotton, Stock: 1"]
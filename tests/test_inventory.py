@@ -0,0 +1,109 @@
+import importlib.util
+from datetime import date, timedelta
+
+import pytest
+
+from test_app import APP
+
+
+@pytest.fixture(scope="module")
+def app_module(tmp_path_factory):
+    # main.py is a Streamlit script; importing it outside a server runs the UI calls in bare mode as no-ops
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("app"))
+        spec = importlib.util.spec_from_file_location("inventory_app", APP)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def grocery(m, pid, expiry):
+    return m.Grocery(pid, f"item {pid}", 1.0, 1, expiry.strftime("%Y-%m-%d"))
+
+
+def test_expiry_tie_between_int_and_str_ids(app_module):
+    inv = app_module.Inventory()
+    today = date.today()
+    inv.add_product(grocery(app_module, 1, today))
+    inv.add_product(grocery(app_module, "x", today))
+    assert len(inv) == 2
+    inv.remove_expired_products()
+    assert len(inv) == 0
+    assert inv.total_inventory_value() == 0
+
+
+def test_stale_expiry_entry_does_not_remove_readded_product(app_module):
+    inv = app_module.Inventory()
+    today = date.today()
+    inv.add_product(grocery(app_module, "g", today))
+    inv.add_product(grocery(app_module, "keep", today + timedelta(days=30)))
+    inv.remove_product("g")
+    inv.add_product(grocery(app_module, "g", today + timedelta(days=30)))
+    inv.remove_expired_products()
+    assert sorted(p._product_id for p in inv.search_by_type("grocery")) == ["g", "keep"]
+
+
+def test_readded_id_with_same_expiry_is_removed_once(app_module):
+    inv = app_module.Inventory()
+    today = date.today()
+    inv.add_product(grocery(app_module, "g", today))
+    inv.add_product(grocery(app_module, "keep", today + timedelta(days=30)))
+    inv.remove_product("g")
+    inv.add_product(grocery(app_module, "g", today))
+    inv.remove_expired_products()
+    assert [p._product_id for p in inv.search_by_type("grocery")] == ["keep"]
+    assert inv._expiry_stale == 0
+
+
+def test_removed_groceries_do_not_grow_expiry_heap(app_module):
+    inv = app_module.Inventory()
+    inv.add_product(grocery(app_module, "keep", date.today() + timedelta(days=30)))
+    for i in range(1, 101):
+        inv.add_product(grocery(app_module, i, date.today()))
+        inv.remove_product(i)
+    assert len(inv._expiry_heap) <= 2
+
+
+def test_failed_bulk_load_leaves_inventory_untouched(app_module):
+    inv = app_module.Inventory()
+    inv.add_product(grocery(app_module, "keep", date.today()))
+    version = inv._version
+
+    def rows():
+        yield grocery(app_module, "new", date.today())
+        raise ValueError("bad record")
+
+    with pytest.raises(ValueError):
+        inv.bulk_load(rows())
+    assert [p._product_id for p in inv.search_by_type("grocery")] == ["keep"]
+    assert inv._version == version
+    inv.remove_expired_products()
+    assert len(inv) == 0
+
+
+def test_grocery_expiry_accepts_the_strptime_format(app_module):
+    assert app_module.Grocery("g", "Milk", 1.0, 1, "2024-1-5")._expiry == date(2024, 1, 5)
+    for bad in ("20241005", "2024-W40-6"):
+        with pytest.raises(ValueError):
+            app_module.Grocery("g", "Milk", 1.0, 1, bad)
+
+
+def test_msgpack_save_load_round_trip(app_module, tmp_path):
+    pytest.importorskip("msgpack")
+    inv = app_module.Inventory()
+    inv.add_product(grocery(app_module, 1, date(2030, 1, 5)))
+    inv.add_product(app_module.Clothing("c", "Shirt", 10.0, 2, "M", "Cotton"))
+    path = str(tmp_path / "inventory.msgpack")
+    inv.save_to_msgpack(path)
+
+    loaded = app_module.Inventory()
+    loaded.load_from_msgpack(path)
+    assert loaded.list_all_products() == inv.list_all_products()
+    assert loaded.total_inventory_value() == inv.total_inventory_value()
+
+
+def test_build_products_leaves_cached_dicts_intact(app_module):
+    shirt = app_module.Clothing("c", "Shirt", 10.0, 2, "M", "Cotton")
+    rebuilt = list(app_module._build_products([shirt.to_dict()]))
+    assert rebuilt[0].to_dict() == shirt.to_dict()
+    assert shirt.to_dict()["type"] == "Clothing"